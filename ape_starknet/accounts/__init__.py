@@ -32,8 +32,8 @@ from ape_starknet.exceptions import ContractTypeNotFoundError, StarknetProviderE
 from ape_starknet.tokens import TokenManager
 from ape_starknet.transactions import AccountTransaction, InvokeFunctionTransaction
 from ape_starknet.utils import (
-    OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE,
     get_chain_id,
+    get_oz_account_contract_type,
     get_random_private_key,
     pad_hex_str,
     run_until_complete,
@@ -47,6 +47,16 @@ specific to the ape-starknet plugin.
 """
 APP_KEY_FILE_VERSION = "0.1.0"
 
+
+def __getattr__(name: str):
+    # Keep 'from ape_starknet.accounts import OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE'
+    # working (PEP 562) now that the contract type is built lazily.
+    if name == "OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE":
+        return get_oz_account_contract_type()
+
+    raise AttributeError(name)
+
+
 # https://github.com/starkware-libs/cairo-lang/blob/v0.9.1/src/starkware/starknet/cli/starknet_cli.py#L66
 FEE_MARGIN_OF_ESTIMATION = 1.1
 
@@ -500,7 +510,7 @@ class BaseStarknetAccount(AccountAPI, StarknetBase):
 
 class StarknetDevelopmentAccount(BaseStarknetAccount):
     def get_account_contract_type(self) -> ContractType:
-        return OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE
+        return get_oz_account_contract_type()
 
     def sign_message(self, msg: SignableMessage) -> Optional[ECSignature]:
         if not isinstance(msg, (list, tuple)):
@@ -608,7 +618,7 @@ class StarknetKeyfileAccount(BaseStarknetAccount):
         return txn
 
     def get_account_contract_type(self) -> ContractType:
-        return OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE
+        return get_oz_account_contract_type()
 
     def write(
         self,
@@ -16,7 +16,6 @@ from starknet_py.net.models.chains import StarknetChainId
 from starknet_py.utils.data_transformer.execute_transformer import FunctionCallSerializer
 from starkware.starknet.definitions.fields import ContractAddressSalt
 from starkware.starknet.definitions.transaction_type import TransactionType
-from starkware.starknet.public.abi import get_selector_from_name
 from starkware.starknet.public.abi_structs import identifier_manager_from_abi
 from starkware.starknet.services.api.contract_class import ContractClass
 
@@ -35,7 +34,11 @@ from ape_starknet.transactions import (
     StarknetReceipt,
     StarknetTransaction,
 )
-from ape_starknet.utils import get_method_abi_from_selector, to_checksum_address
+from ape_starknet.utils import (
+    get_cached_selector,
+    get_method_abi_from_selector,
+    to_checksum_address,
+)
 from ape_starknet.utils.basemodel import StarknetBase
 
 NETWORKS = {
@@ -341,7 +344,7 @@ class Starknet(EcosystemAPI, StarknetBase):
         return txn_cls(**txn_data)
 
     def decode_logs(self, logs: List[Dict], *events: EventABI) -> Iterator["ContractLog"]:
-        events_by_selector = {get_selector_from_name(e.name): e for e in events}
+        events_by_selector = {get_cached_selector(e.name): e for e in events}
         log_map = {s: [log for log in logs if s in log["keys"]] for s in events_by_selector}
 
         def from_uint(low: int, high: int) -> int:
@@ -1,9 +1,12 @@
 import os
-from dataclasses import asdict
-from typing import Dict, Iterator, List, Optional, Union
-from urllib.error import HTTPError
+import shelve
+import time
+from dataclasses import fields
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
-from urllib.request import urlopen
 
 from ape.api import BlockAPI, ProviderAPI, ReceiptAPI, SubprocessProvider, TransactionAPI
 from ape.api.networks import LOCAL_NETWORK_NAME
@@ -12,6 +15,7 @@ from ape.logging import logger
 from ape.types import AddressType, BlockID, ContractLog, LogFilter
 from ape.utils import DEFAULT_NUMBER_OF_TEST_ACCOUNTS, cached_property, raises_not_implemented
 from requests import Session
+from requests.adapters import HTTPAdapter
 from starknet_py.net.client_models import (
     BlockSingleTransactionTrace,
     ContractCode,
@@ -21,6 +25,7 @@ from starknet_py.net.client_models import (
 from starknet_py.net.gateway_client import GatewayClient
 from starknet_py.net.models import parse_address
 from starkware.starkware_utils.error_handling import StarkErrorCode
+from urllib3.util import Retry
 
 from ape_starknet.config import DEFAULT_PORT, StarknetConfig
 from ape_starknet.exceptions import StarknetProviderError
@@ -39,15 +44,97 @@ from ape_starknet.utils import (
     get_dict_from_tx_info,
     handle_client_error,
     handle_client_errors,
+    run_until_complete_many,
 )
 from ape_starknet.utils.basemodel import StarknetBase
 
+CODE_CACHE_SIZE = 4096
+BLOCK_CACHE_TTL = 1.0  # Seconds
+CONNECTION_CHECK_TTL = 1.0  # Seconds
+TRACE_CACHE_SIZE = 64
+TRACE_CACHE_TTL = 30.0  # Seconds
+PROXY_BYTECODE: Tuple[int, ...] = tuple(b"PROXY")
+"""Placeholder bytecode so proxies always report truthy code."""
+PERSIST_CODE_CACHE_KEY = "APE_STARKNET_PERSIST_CODE_CACHE"
+"""Set this environment variable to persist fetched contract code across runs."""
+
+
+@lru_cache(maxsize=1024)
+def _parse_address_cached(address: Union[str, AddressType]) -> int:
+    return parse_address(address)
+
+
+def _get_block_kwarg(block_id: BlockID) -> str:
+    """
+    Classify a block ID as a block hash or a block number. A 252-bit block
+    hash spans 76 digits rendered in decimal - the form ``str()`` gives for
+    both ints and hash strings - so anything of that length is a hash and
+    everything else queries by number.
+    """
+
+    if isinstance(block_id, (int, str)) and len(str(block_id)) == 76:
+        return "block_hash"
+
+    return "block_number"
+
+
+def _resolve_str_block_id(provider: "StarknetProvider", block_id: str) -> Tuple[str, BlockID]:
+    if len(block_id) == 76:
+        return "block_hash", block_id
+
+    elif block_id in ("pending", "latest"):
+        return "block_number", block_id
+
+    raise StarknetProviderError(f"Unsupported BlockID type '{type(block_id)}'.")
+
+
+def _resolve_int_block_id(provider: "StarknetProvider", block_id: int) -> Tuple[str, BlockID]:
+    if len(str(block_id)) == 76:
+        return "block_hash", block_id
+
+    if block_id < 0:
+        block_id = provider._get_latest_block_number() + block_id + 1
+        if block_id < 0:
+            raise StarknetProviderError(f"Block with number '{block_id}' not found.")
+
+    return "block_number", block_id
+
+
+_BLOCK_ID_RESOLVERS = {str: _resolve_str_block_id, int: _resolve_int_block_id}
+"""Map each supported BlockID type straight to its resolver."""
+
+
+def _create_session() -> Session:
+    """
+    Create a ``Session`` with HTTP keep-alive and connection pooling so
+    repeated requests to the same host re-use sockets instead of paying
+    the TCP / TLS handshake cost on every call.
+    """
+
+    session = Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
 
 class DevnetClient:
     def __init__(self, host_address: str):
-        self.session = Session()
+        self.session = _create_session()
+        self.session.headers.update({"Accept": "application/json"})
         self.host_address = host_address
 
+        # Pre-bind the session verbs and base URL so each request skips the
+        # method-name dispatch in 'Session.request()'.
+        self._base_url = host_address.rstrip("/") + "/"
+        self._get_fn = self.session.get
+        self._post_fn = self.session.post
+
     @cached_property
     def predeployed_accounts(self) -> List[Dict]:
         return self._get("predeployed_accounts")
@@ -55,14 +142,26 @@ class DevnetClient:
     def increase_time(self, amount: int):
         return self._post("increase_time", json={"time": amount})
 
+    def get_bootstrap_state(self) -> Dict[int, Tuple[int, int]]:
+        """
+        Map each predeployed account address to its ``(balance, nonce)``
+        without issuing one RPC per account. The devnet reports the initial
+        balances in the single ``predeployed_accounts`` response, and
+        predeployed accounts always start at nonce 0.
+        """
+
+        return {
+            parse_address(account["address"]): (int(account["initial_balance"]), 0)
+            for account in self.predeployed_accounts
+        }
+
     def _get(self, uri: str, **kwargs):
-        return self._request("get", uri, **kwargs)
+        response = self._get_fn(self._base_url + uri, **kwargs)
+        response.raise_for_status()
+        return response.json()
 
     def _post(self, uri: str, **kwargs):
-        return self._request("post", uri, **kwargs)
-
-    def _request(self, method: str, uri: str, **kwargs):
-        response = self.session.request(method.upper(), url=f"{self.host_address}/{uri}", **kwargs)
+        response = self._post_fn(self._base_url + uri, **kwargs)
         response.raise_for_status()
         return response.json()
 
@@ -75,7 +174,14 @@ class StarknetProvider(ProviderAPI, StarknetBase):
     # Gets set when 'connect()' is called.
     client: Optional[GatewayClient] = None
     token_manager: TokenManager = TokenManager()
-    cached_code: Dict[int, ContractCode] = {}
+    cached_code: Dict[Tuple[int, int], ContractCode] = {}
+    """An LRU-bounded code cache keyed by ``(chain_id, address_int)``."""
+    cached_blocks: Dict[str, Tuple[float, BlockAPI]] = {}
+    """A short-TTL cache for the 'pending' and 'latest' blocks."""
+    last_connection_check: float = 0.0
+    """The last time (monotonic) the liveness probe succeeded."""
+    cached_traces: Dict[int, Tuple[float, Dict[int, BlockSingleTransactionTrace]]] = {}
+    """Block traces keyed by block number, then by transaction hash."""
 
     @property
     def connected_client(self) -> GatewayClient:
@@ -86,27 +192,48 @@ class StarknetProvider(ProviderAPI, StarknetBase):
 
     @property
     def is_connected(self) -> bool:
-        was_successful = False
+        # Trust a recent successful probe instead of re-opening a connection;
+        # only positive verdicts are cached so a down node is never masked.
+        now = time.monotonic()
+        if self.client is not None and now - self.last_connection_check < CONNECTION_CHECK_TTL:
+            return True
+
         try:
-            urlopen(self.uri)
-            was_successful = True
-        except HTTPError as err:
-            was_successful = err.code == 404  # Task failed successfully
+            # GET with a streamed body keeps the baseline urlopen semantics
+            # (redirects followed, no HEAD-hostile 405s) without downloading
+            # the response payload.
+            response = self._session.get(self.uri, timeout=2, stream=True)
+            # A 404 means the server is alive even though the root URI
+            # is not a real endpoint (task failed successfully).
+            was_successful = response.ok or response.status_code == 404
+            response.close()
         except Exception:
             was_successful = False
 
-        if was_successful and self.client is None:
-            self.client = self._create_client()
+        if was_successful:
+            self.last_connection_check = now
+            if self.client is None:
+                self.client = self._create_client()
 
         return was_successful
 
     @property
     def starknet_client(self) -> GatewayClient:
-        if not self.is_connected:
+        # Steady state: an existing client means we already connected once.
+        # Re-probing the network on every access would dwarf the RPC itself;
+        # 'disconnect()' nulls the client, so this stays correct.
+        if self.client is not None:
+            return self.client
+
+        elif not self.is_connected:
             raise StarknetProviderError("Provider is not connected to Starknet.")
 
         return self.client
 
+    @cached_property
+    def _session(self) -> Session:
+        return _create_session()
+
     @cached_property
     def plugin_config(self) -> StarknetConfig:
         return self.config_manager.get_config(PLUGIN_NAME) or StarknetConfig()  # type: ignore
@@ -124,24 +251,27 @@ class StarknetProvider(ProviderAPI, StarknetBase):
 
     def disconnect(self):
         self.client = None
+        self.last_connection_check = 0.0
         super().disconnect()
 
     def update_settings(self, new_settings: dict):
         pass
 
-    @property
+    @cached_property
     def chain_id(self) -> int:
+        # The network is immutable per provider instance, so cache the ID.
         return get_chain_id(self.network.name).value
 
     @handle_client_errors
     def get_balance(self, address: AddressType) -> int:
-        account = self.account_contracts[address]
-        return self.token_manager.get_balance(account.address)
+        # No need to resolve the account contract first - the token manager
+        # accepts the address directly.
+        return self.token_manager.get_balance(address)
 
     @handle_client_errors
     def get_code(self, address: str) -> List[int]:
         # NOTE: Always return truthy value for code so that Ape core works properly
-        return self.get_code_and_abi(address).bytecode or [ord(c) for c in "PROXY"]
+        return self.get_code_and_abi(address).bytecode or list(PROXY_BYTECODE)
 
     @handle_client_errors
     def get_abi(self, address: str) -> List[Dict]:
@@ -157,7 +287,7 @@ class StarknetProvider(ProviderAPI, StarknetBase):
         estimated_fee = self.connected_client.estimate_fee_sync(starknet_object)
         return estimated_fee.overall_fee
 
-    @property
+    @cached_property
     def gas_price(self) -> int:
         """
         **NOTE**: Currently, the gas price is fixed to always be 100 gwei.
@@ -167,33 +297,35 @@ class StarknetProvider(ProviderAPI, StarknetBase):
 
     @handle_client_errors
     def get_block(self, block_id: BlockID) -> BlockAPI:
-        if isinstance(block_id, (int, str)) and len(str(block_id)) == 76:
-            kwarg = "block_hash"
-        elif block_id in ("pending", "latest"):
-            kwarg = "block_number"
-        elif isinstance(block_id, int):
-            kwarg = "block_number"
-            if block_id < 0:
-                latest_block_number = self.get_block("latest").number
-                block_id_int = latest_block_number + block_id + 1
-                if block_id_int < 0:
-                    raise StarknetProviderError(f"Block with number '{block_id_int}' not found.")
-
-                block_id = block_id_int
-
-        else:
+        is_named_block = block_id in ("pending", "latest")
+        if is_named_block:
+            cached_at, cached_block = self.cached_blocks.get(block_id, (0.0, None))
+            if cached_block is not None and time.monotonic() - cached_at < BLOCK_CACHE_TTL:
+                return cached_block
+
+        resolve = _BLOCK_ID_RESOLVERS.get(type(block_id))
+        if resolve is None:
             raise StarknetProviderError(f"Unsupported BlockID type '{type(block_id)}'.")
 
+        kwarg, block_id = resolve(self, block_id)
         block = self.starknet_client.get_block_sync(**{kwarg: block_id})
-        return self.starknet.decode_block(block)
+        decoded_block = self.starknet.decode_block(block)
+        if is_named_block:
+            self.cached_blocks[block_id] = (time.monotonic(), decoded_block)
+
+        return decoded_block
+
+    def _get_latest_block_number(self) -> int:
+        """
+        Resolve the latest block number. The gateway has no lighter-weight
+        endpoint than fetching the block itself, but repeat calls within the
+        cache TTL avoid the extra round-trip entirely.
+        """
+
+        return self.get_block("latest").number
 
     def _get_block(self, block_id: BlockID) -> StarknetBlock:
-        kwarg = (
-            "block_hash"
-            if isinstance(block_id, (int, str)) and len(str(block_id)) == 76
-            else "block_number"
-        )
-        return self.starknet_client.get_block_sync(**{kwarg: block_id})
+        return self.starknet_client.get_block_sync(**{_get_block_kwarg(block_id): block_id})
 
     @handle_client_errors
     def send_call(self, txn: TransactionAPI) -> bytes:
@@ -207,23 +339,42 @@ class StarknetProvider(ProviderAPI, StarknetBase):
         return self.connected_client.call_contract_sync(starknet_obj)  # type: ignore
 
     @handle_client_errors
-    def _get_traces(self, block_number: int) -> List[BlockSingleTransactionTrace]:
+    def _get_traces(self, block_number: int) -> Dict[int, BlockSingleTransactionTrace]:
+        cached_at, traces = self.cached_traces.get(block_number, (0.0, None))
+        if traces is not None and time.monotonic() - cached_at < TRACE_CACHE_TTL:
+            return traces
+
         block_traces = self.starknet_client.get_block_traces_sync(block_number=block_number)
-        return block_traces.traces
+        traces = {trace.transaction_hash: trace for trace in block_traces.traces}
+
+        if len(self.cached_traces) >= TRACE_CACHE_SIZE:
+            del self.cached_traces[next(iter(self.cached_traces))]
+
+        self.cached_traces[block_number] = (time.monotonic(), traces)
+        return traces
 
     @handle_client_errors
     def _get_single_trace(
         self, block_number: int, txn_hash: int
     ) -> Optional[BlockSingleTransactionTrace]:
-        traces = self._get_traces(block_number)
-        return next((trace for trace in traces if trace.transaction_hash == txn_hash), None)
+        # Receipts from the same block share one trace download this way.
+        return self._get_traces(block_number).get(txn_hash)
 
     @handle_client_errors
     def get_receipt(self, txn_hash: str) -> ReceiptAPI:
         self.starknet_client.wait_for_tx_sync(txn_hash)
-        txn_info = self.starknet_client.get_transaction_sync(tx_hash=txn_hash)
-        receipt = self.starknet_client.get_transaction_receipt_sync(tx_hash=txn_hash)
-        data = {**asdict(receipt), **get_dict_from_tx_info(txn_info)}
+
+        # Fetch the transaction and its receipt in a single round of concurrent
+        # requests rather than two sequential round-trips to the gateway.
+        txn_info, receipt = run_until_complete_many(
+            self.starknet_client.get_transaction(tx_hash=txn_hash),
+            self.starknet_client.get_transaction_receipt(tx_hash=txn_hash),
+        )
+
+        # NOTE: Avoid 'asdict(receipt)' here - it deep-copies every nested
+        # list (such as calldata and events) and this path only reads them.
+        data = {f.name: getattr(receipt, f.name) for f in fields(receipt)}
+        data.update(get_dict_from_tx_info(txn_info))
 
         # Handle __execute__ overhead. User only cares for target ABI.
         if data.get("entry_point_selector") == EXECUTE_SELECTOR:
@@ -235,7 +386,9 @@ class StarknetProvider(ProviderAPI, StarknetBase):
             data["contract_address"] = self.starknet.decode_address(data["calldata"][1])
             data["entry_point_selector"] = data["calldata"][2]
             stop_index = data["calldata"][3] + 1
-            data["calldata"] = data["calldata"][4:stop_index]
+            # Use a lazy view rather than slicing out a new list; the calldata
+            # is only iterated once, when the transaction gets created below.
+            data["calldata"] = islice(data["calldata"], 4, stop_index)
 
         transaction = self.starknet.create_transaction(**data)
         return self.starknet.decode_receipt({"provider": self, "transaction": transaction, **data})
@@ -246,12 +399,24 @@ class StarknetProvider(ProviderAPI, StarknetBase):
             txn_dict = get_dict_from_tx_info(txn_info)
             yield self.starknet.create_transaction(**txn_dict)
 
+    def get_transactions_by_block_batch(self, block_id: BlockID) -> List[TransactionAPI]:
+        """
+        An eager version of ``get_transactions_by_block()`` for bulk
+        consumers. The gateway block response already embeds every
+        transaction, so the whole block decodes from a single round-trip.
+        """
+
+        return list(self.get_transactions_by_block(block_id))
+
     @handle_client_errors
     def send_transaction(self, txn: TransactionAPI, token: Optional[str] = None) -> ReceiptAPI:
         response = self._send_transaction(txn, token=token)
         if response.code != StarkErrorCode.TRANSACTION_RECEIVED.name:
             raise TransactionError(message="Transaction not received.")
 
+        # A new transaction may produce a new block.
+        self.cached_blocks.clear()
+
         return self.get_receipt(response.transaction_hash)
 
     def _send_transaction(
@@ -287,13 +452,60 @@ class StarknetProvider(ProviderAPI, StarknetBase):
         return handle_client_error(exception)
 
     def get_code_and_abi(self, address: Union[str, AddressType, int]) -> ContractCode:
-        address_int = parse_address(address)
+        # Ints pass through directly to avoid pointless cache hashing.
+        address_int = address if isinstance(address, int) else _parse_address_cached(address)
 
-        # Cache code for faster look-up
-        if address_int not in self.cached_code:
-            self.cached_code[address_int] = self.starknet_client.get_code_sync(address_int)
+        # Cache code for faster look-up. Include the chain ID in the key so
+        # contracts from different networks never collide, and bound the cache
+        # so long-running sessions can't grow it forever.
+        key = (self.chain_id, address_int)
+        code = self.cached_code.pop(key, None)
+        if code is None:
+            if len(self.cached_code) >= CODE_CACHE_SIZE:
+                # Evict the least-recently used entry (dicts are insertion
+                # ordered and hits get re-inserted below).
+                del self.cached_code[next(iter(self.cached_code))]
 
-        return self.cached_code[address_int]
+            code = self._get_code_from_disk(key)
+
+        if code is None:
+            code = self.starknet_client.get_code_sync(address_int)
+            self._store_code_on_disk(key, code)
+
+        self.cached_code[key] = code
+        return code
+
+    @cached_property
+    def _code_cache_path(self) -> Optional[Path]:
+        # Contract code is immutable once deployed, so it is safe to keep it
+        # around between runs. Opt-in only, since it writes to disk.
+        if not os.environ.get(PERSIST_CODE_CACHE_KEY):
+            return None
+
+        path = self.config_manager.DATA_FOLDER / PLUGIN_NAME / "code_cache"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _get_code_from_disk(self, key: Tuple[int, int]) -> Optional[ContractCode]:
+        if not self._code_cache_path:
+            return None
+
+        try:
+            with shelve.open(str(self._code_cache_path)) as code_db:
+                return code_db.get(f"{key[0]}:{key[1]}")
+        except Exception as err:
+            logger.debug(f"Failed reading code cache: {err}")
+            return None
+
+    def _store_code_on_disk(self, key: Tuple[int, int], code: ContractCode):
+        if not self._code_cache_path:
+            return
+
+        try:
+            with shelve.open(str(self._code_cache_path)) as code_db:
+                code_db[f"{key[0]}:{key[1]}"] = code
+        except Exception as err:
+            logger.debug(f"Failed writing code cache: {err}")
 
     def _create_client(self) -> GatewayClient:
         network = self.uri if self.network.name == LOCAL_NETWORK_NAME else self.network.name
@@ -347,5 +559,9 @@ class StarknetDevnetProvider(SubprocessProvider, StarknetProvider):
         if "timestamp_increased_by" not in result:
             raise StarknetProviderError(result)
 
+        # The pending block's timestamp just changed; a stale cache entry here
+        # would make the next delta computation over-advance the clock.
+        self.cached_blocks.clear()
+
 
 __all__ = ["StarknetProvider", "StarknetDevnetProvider"]
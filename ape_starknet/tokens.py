@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Dict, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple, Union
 
 from ape.api import Address
 from ape.api.networks import LOCAL_NETWORK_NAME
@@ -22,160 +23,186 @@ def missing_contract_error(token: str, contract_address: AddressType) -> Contrac
     return ContractError(f"Incorrect '{token}' contract address '{contract_address}'.")
 
 
-ERC20 = ContractType(
-    **{
-        "contractName": "ERC20",
-        "abi": [
-            {
-                "type": "struct",
-                "name": "Uint256",
-                "members": [
-                    {"name": "low", "type": "felt", "offset": 0},
-                    {"name": "high", "type": "felt", "offset": 1},
-                ],
-                "size": 2,
-            },
-            {
-                "type": "event",
-                "name": "Transfer",
-                "inputs": [
-                    {"name": "from_", "type": "felt", "indexed": False},
-                    {"name": "to", "type": "felt", "indexed": False},
-                    {"name": "value", "type": "Uint256", "indexed": False},
-                ],
-                "anonymous": False,
-            },
-            {
-                "type": "event",
-                "name": "Approval",
-                "inputs": [
-                    {"name": "owner", "type": "felt", "indexed": False},
-                    {"name": "spender", "type": "felt", "indexed": False},
-                    {"name": "value", "type": "Uint256", "indexed": False},
-                ],
-                "anonymous": False,
-            },
-            {
-                "type": "constructor",
-                "stateMutability": "nonpayable",
-                "inputs": [
-                    {"name": "name", "type": "felt"},
-                    {"name": "symbol", "type": "felt"},
-                    {"name": "decimals", "type": "felt"},
-                    {"name": "initial_supply", "type": "Uint256"},
-                    {"name": "recipient", "type": "felt"},
-                ],
-            },
-            {
-                "type": "function",
-                "name": "name",
-                "stateMutability": "view",
-                "inputs": [],
-                "outputs": [{"name": "name", "type": "felt"}],
-            },
-            {
-                "type": "function",
-                "name": "symbol",
-                "stateMutability": "view",
-                "inputs": [],
-                "outputs": [{"name": "symbol", "type": "felt"}],
-            },
-            {
-                "type": "function",
-                "name": "totalSupply",
-                "stateMutability": "view",
-                "inputs": [],
-                "outputs": [{"name": "totalSupply", "type": "Uint256"}],
-            },
-            {
-                "type": "function",
-                "name": "decimals",
-                "stateMutability": "view",
-                "inputs": [],
-                "outputs": [{"name": "decimals", "type": "felt"}],
-            },
-            {
-                "type": "function",
-                "name": "balanceOf",
-                "stateMutability": "view",
-                "inputs": [{"name": "account", "type": "felt"}],
-                "outputs": [{"name": "balance", "type": "Uint256"}],
-            },
-            {
-                "type": "function",
-                "name": "allowance",
-                "stateMutability": "view",
-                "inputs": [{"name": "owner", "type": "felt"}, {"name": "spender", "type": "felt"}],
-                "outputs": [{"name": "remaining", "type": "Uint256"}],
-            },
-            {
-                "type": "function",
-                "name": "transfer",
-                "stateMutability": "nonpayable",
-                "inputs": [
-                    {"name": "recipient", "type": "felt"},
-                    {"name": "amount", "type": "Uint256"},
-                ],
-                "outputs": [{"name": "success", "type": "felt"}],
-            },
-            {
-                "type": "function",
-                "name": "transferFrom",
-                "stateMutability": "nonpayable",
-                "inputs": [
-                    {"name": "sender", "type": "felt"},
-                    {"name": "recipient", "type": "felt"},
-                    {"name": "amount", "type": "Uint256"},
-                ],
-                "outputs": [{"name": "success", "type": "felt"}],
-            },
-            {
-                "type": "function",
-                "name": "approve",
-                "stateMutability": "nonpayable",
-                "inputs": [
-                    {"name": "spender", "type": "felt"},
-                    {"name": "amount", "type": "Uint256"},
-                ],
-                "outputs": [{"name": "success", "type": "felt"}],
-            },
-            {
-                "type": "function",
-                "name": "increaseAllowance",
-                "stateMutability": "nonpayable",
-                "inputs": [
-                    {"name": "spender", "type": "felt"},
-                    {"name": "added_value", "type": "Uint256"},
-                ],
-                "outputs": [{"name": "success", "type": "felt"}],
-            },
-            {
-                "type": "function",
-                "name": "decreaseAllowance",
-                "stateMutability": "nonpayable",
-                "inputs": [
-                    {"name": "spender", "type": "felt"},
-                    {"name": "subtracted_value", "type": "Uint256"},
-                ],
-                "outputs": [{"name": "success", "type": "felt"}],
-            },
-        ],
-    }
-)
+_ERC20_RAW = {
+    "contractName": "ERC20",
+    "abi": [
+        {
+            "type": "struct",
+            "name": "Uint256",
+            "members": [
+                {"name": "low", "type": "felt", "offset": 0},
+                {"name": "high", "type": "felt", "offset": 1},
+            ],
+            "size": 2,
+        },
+        {
+            "type": "event",
+            "name": "Transfer",
+            "inputs": [
+                {"name": "from_", "type": "felt", "indexed": False},
+                {"name": "to", "type": "felt", "indexed": False},
+                {"name": "value", "type": "Uint256", "indexed": False},
+            ],
+            "anonymous": False,
+        },
+        {
+            "type": "event",
+            "name": "Approval",
+            "inputs": [
+                {"name": "owner", "type": "felt", "indexed": False},
+                {"name": "spender", "type": "felt", "indexed": False},
+                {"name": "value", "type": "Uint256", "indexed": False},
+            ],
+            "anonymous": False,
+        },
+        {
+            "type": "constructor",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {"name": "name", "type": "felt"},
+                {"name": "symbol", "type": "felt"},
+                {"name": "decimals", "type": "felt"},
+                {"name": "initial_supply", "type": "Uint256"},
+                {"name": "recipient", "type": "felt"},
+            ],
+        },
+        {
+            "type": "function",
+            "name": "name",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"name": "name", "type": "felt"}],
+        },
+        {
+            "type": "function",
+            "name": "symbol",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"name": "symbol", "type": "felt"}],
+        },
+        {
+            "type": "function",
+            "name": "totalSupply",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"name": "totalSupply", "type": "Uint256"}],
+        },
+        {
+            "type": "function",
+            "name": "decimals",
+            "stateMutability": "view",
+            "inputs": [],
+            "outputs": [{"name": "decimals", "type": "felt"}],
+        },
+        {
+            "type": "function",
+            "name": "balanceOf",
+            "stateMutability": "view",
+            "inputs": [{"name": "account", "type": "felt"}],
+            "outputs": [{"name": "balance", "type": "Uint256"}],
+        },
+        {
+            "type": "function",
+            "name": "allowance",
+            "stateMutability": "view",
+            "inputs": [{"name": "owner", "type": "felt"}, {"name": "spender", "type": "felt"}],
+            "outputs": [{"name": "remaining", "type": "Uint256"}],
+        },
+        {
+            "type": "function",
+            "name": "transfer",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {"name": "recipient", "type": "felt"},
+                {"name": "amount", "type": "Uint256"},
+            ],
+            "outputs": [{"name": "success", "type": "felt"}],
+        },
+        {
+            "type": "function",
+            "name": "transferFrom",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {"name": "sender", "type": "felt"},
+                {"name": "recipient", "type": "felt"},
+                {"name": "amount", "type": "Uint256"},
+            ],
+            "outputs": [{"name": "success", "type": "felt"}],
+        },
+        {
+            "type": "function",
+            "name": "approve",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {"name": "spender", "type": "felt"},
+                {"name": "amount", "type": "Uint256"},
+            ],
+            "outputs": [{"name": "success", "type": "felt"}],
+        },
+        {
+            "type": "function",
+            "name": "increaseAllowance",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {"name": "spender", "type": "felt"},
+                {"name": "added_value", "type": "Uint256"},
+            ],
+            "outputs": [{"name": "success", "type": "felt"}],
+        },
+        {
+            "type": "function",
+            "name": "decreaseAllowance",
+            "stateMutability": "nonpayable",
+            "inputs": [
+                {"name": "spender", "type": "felt"},
+                {"name": "subtracted_value", "type": "Uint256"},
+            ],
+            "outputs": [{"name": "success", "type": "felt"}],
+        },
+    ],
+}
 TEST_TOKEN_ADDRESS = "0x07394cbe418daa16e42b87ba67372d4ab4a5df0b05c6e554d158458ce245bc10"
 
 
+@lru_cache(maxsize=1)
+def _erc20() -> ContractType:
+    # Validating the ERC20 ABI is slow enough to matter for CLI start-up,
+    # so defer it until tokens are actually used.
+    return ContractType(**_ERC20_RAW)
+
+
+def __getattr__(name: str):
+    # Keep 'from ape_starknet.tokens import ERC20' working (PEP 562).
+    if name == "ERC20":
+        return _erc20()
+
+    raise AttributeError(name)
+
+
 class TokenManager(StarknetBase):
     # The 'test_token' refers to the token that comes with Argent-X
     additional_tokens: Dict = {}
-    contract_type = ERC20
+
+    # Lazily built and invalidated by 'add_token()'. Kept on the class - like
+    # 'additional_tokens', which they cache - so invalidation reaches every
+    # live TokenManager instance.
+    _merged_map: Optional[Dict] = None
+    _token_addresses_by_network: Optional[Dict[str, Set[AddressType]]] = None
+    _instance_cache: Optional[Dict[Tuple[str, str], ContractInstance]] = None
+
+    @property
+    def contract_type(self) -> ContractType:
+        return _erc20()
 
     @property
     def token_address_map(self) -> Dict:
-        return {
-            **self._base_token_address_map,
-            **self.additional_tokens,
-        }
+        if TokenManager._merged_map is None:
+            TokenManager._merged_map = {
+                **self._base_token_address_map,
+                **self.additional_tokens,
+            }
+
+        return TokenManager._merged_map
 
     @cached_property
     def _base_token_address_map(self):
@@ -195,17 +222,40 @@ class TokenManager(StarknetBase):
 
     def __getitem__(self, token: str) -> ContractInstance:
         network = self.provider.network.name
+        if TokenManager._instance_cache is None:
+            TokenManager._instance_cache = {}
+
+        # Creating a 'ContractInstance' re-parses the ABI, so re-use instances.
+        cache_key = (token.lower(), network)
+        instance = TokenManager._instance_cache.get(cache_key)
+        if instance is not None:
+            return instance
+
         contract_address = AddressType(
             HexAddress(HexStr(self.token_address_map[token.lower()].get(network)))
         )
         if not contract_address:
             raise ContractTypeNotFoundError(contract_address)
 
-        return ContractInstance(contract_address, ERC20)
+        instance = ContractInstance(contract_address, _erc20())
+        TokenManager._instance_cache[cache_key] = instance
+        return instance
 
     def is_token(self, address: AddressType) -> bool:
         network = self.provider.network.name
-        return any(address == networks.get(network) for networks in self.token_address_map.values())
+        if TokenManager._token_addresses_by_network is None:
+            TokenManager._token_addresses_by_network = {}
+
+        addresses = TokenManager._token_addresses_by_network.get(network)
+        if addresses is None:
+            addresses = {
+                networks[network]
+                for networks in self.token_address_map.values()
+                if network in networks
+            }
+            TokenManager._token_addresses_by_network[network] = addresses
+
+        return address in addresses
 
     def add_token(self, name: str, network: str, address: AddressType):
         if name not in self.additional_tokens:
@@ -213,6 +263,11 @@ class TokenManager(StarknetBase):
 
         self.additional_tokens[name][network] = address
 
+        # Force the lookup caches to rebuild with the new token.
+        TokenManager._merged_map = None
+        TokenManager._token_addresses_by_network = None
+        TokenManager._instance_cache = None
+
     def get_balance(self, account: Union[Address, AddressType], token: str = "eth") -> int:
         if hasattr(account, "address"):
             account = account.address  # type: ignore
@@ -17,15 +17,15 @@ from starkware.starknet.core.os.transaction_hash.transaction_hash import (
     calculate_deploy_transaction_hash,
     calculate_transaction_hash_common,
 )
-from starkware.starknet.public.abi import get_selector_from_name
 from starkware.starknet.services.api.contract_class import ContractClass
 
 from ape_starknet.exceptions import ContractTypeNotFoundError
 from ape_starknet.utils import (
-    EXECUTE_ABI,
-    OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE,
     ContractEventABI,
     extract_trace_data,
+    get_cached_selector,
+    get_execute_abi,
+    get_oz_account_contract_type,
     to_checksum_address,
     to_int,
 )
@@ -184,7 +184,7 @@ class InvokeFunctionTransaction(AccountTransaction):
 
     @property
     def entry_point_selector(self) -> int:
-        return get_selector_from_name(self.method_abi.name)
+        return get_cached_selector(self.method_abi.name)
 
     @property
     def txn_hash(self) -> HexBytes:
@@ -226,15 +226,16 @@ class InvokeFunctionTransaction(AccountTransaction):
             "data_offset": 0,
             "data_len": len(stark_tx.calldata),
         }
-        full_abi = OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE.abi
+        execute_abi = get_execute_abi()
+        full_abi = get_oz_account_contract_type().abi
         entire_call_data = [[account_call], stark_tx.calldata]
-        self.data = self.starknet.encode_calldata(full_abi, EXECUTE_ABI, entire_call_data)
+        self.data = self.starknet.encode_calldata(full_abi, execute_abi, entire_call_data)
 
         if self.sender:
             self.receiver = self.sender
 
         self.sender = None
-        self.method_abi = EXECUTE_ABI
+        self.method_abi = execute_abi
         return self
 
 
@@ -353,7 +354,7 @@ class InvocationReceipt(StarknetReceipt):
             contract_types = self.chain_manager.contracts.get_multiple(address_map.values())
             # address → selector → abi
             selectors = {
-                address: {get_selector_from_name(e.name): e for e in contract.events}
+                address: {get_cached_selector(e.name): e for e in contract.events}
                 for address, contract in contract_types.items()
             }
             for log in log_data_items:
@@ -1,15 +1,17 @@
 import asyncio
-import re
-from dataclasses import asdict
+import atexit
+import threading
+from dataclasses import fields
+from functools import lru_cache, wraps
 from json import JSONDecodeError, loads
-from typing import Any, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_type_hints
 
 from ape.api.networks import LOCAL_NETWORK_NAME
 from ape.contracts import ContractEvent
 from ape.exceptions import ApeException, ContractError, ContractLogicError, OutOfGasError
 from ape.types import AddressType, RawAddress
 from eth_typing import HexAddress, HexStr
-from eth_utils import add_0x_prefix, is_text, remove_0x_prefix
+from eth_utils import add_0x_prefix, is_text
 from eth_utils import to_int as eth_to_int
 from ethpm_types import ContractType
 from ethpm_types.abi import EventABI, MethodABI
@@ -26,7 +28,6 @@ from starknet_py.net.client_models import (
 from starknet_py.net.models import TransactionType
 from starknet_py.net.models.address import parse_address
 from starknet_py.transaction_exceptions import TransactionRejectedError
-from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash
 from starkware.crypto.signature.signature import get_random_private_key as get_random_pkey
 from starkware.starknet.definitions.general_config import StarknetChainId
 from starkware.starknet.public.abi import get_selector_from_name
@@ -40,13 +41,30 @@ NETWORKS = {
     "mainnet": (StarknetChainId.MAINNET.value, StarknetChainId.MAINNET.value),
     "testnet": (StarknetChainId.TESTNET.value, StarknetChainId.TESTNET.value),
 }
-_HEX_ADDRESS_REG_EXP = re.compile("(0x)?[0-9a-f]*", re.IGNORECASE | re.ASCII)
-"""Same as from eth-utils except not limited length."""
+_HEX_CHARS = b"0123456789abcdefABCDEF"
 ALPHA_MAINNET_WL_DEPLOY_TOKEN_KEY = "ALPHA_MAINNET_WL_DEPLOY_TOKEN"
-EXECUTE_SELECTOR = get_selector_from_name("__execute__")
 DEFAULT_ACCOUNT_SEED = 2147483647  # Prime
 ContractEventABI = Union[List[Union[EventABI, ContractEvent]], Union[EventABI, ContractEvent]]
-OZ_CONTRACT_CLASS = DevnetAccount.get_contract_class()
+
+
+@lru_cache(maxsize=1024)
+def get_cached_selector(name: str) -> int:
+    """
+    A cached ``get_selector_from_name()``. Computing a selector runs a
+    Starkware hash, and the same few names come up on every transaction.
+    """
+
+    return get_selector_from_name(name)
+
+
+EXECUTE_SELECTOR = get_cached_selector("__execute__")
+
+
+@lru_cache(maxsize=1)
+def get_oz_contract_class() -> ContractClass:
+    # Deserializing the devnet's bundled account program is one of the most
+    # expensive steps of importing this plugin; build it on first use instead.
+    return DevnetAccount.get_contract_class()
 
 
 def convert_contract_class_to_contract_type(contract_class: ContractClass):
@@ -61,53 +79,115 @@ def convert_contract_class_to_contract_type(contract_class: ContractClass):
     )
 
 
-OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE = convert_contract_class_to_contract_type(OZ_CONTRACT_CLASS)
-EXECUTE_ABI = OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE.mutable_methods["__execute__"]  # type: ignore
+@lru_cache(maxsize=1)
+def get_oz_account_contract_type() -> ContractType:
+    return convert_contract_class_to_contract_type(get_oz_contract_class())
+
+
+@lru_cache(maxsize=1)
+def get_execute_abi() -> MethodABI:
+    return get_oz_account_contract_type().mutable_methods["__execute__"]  # type: ignore
+
+
+def __getattr__(name: str):
+    # Keep the historical module constants importable (PEP 562).
+    if name == "OZ_CONTRACT_CLASS":
+        return get_oz_contract_class()
+    elif name == "OPEN_ZEPPELIN_ACCOUNT_CONTRACT_TYPE":
+        return get_oz_account_contract_type()
+    elif name == "EXECUTE_ABI":
+        return get_execute_abi()
+
+    raise AttributeError(name)
+
+
+_CHAIN_IDS_BY_KEY: Dict[Union[str, int], StarknetChainId] = {
+    LOCAL_NETWORK_NAME: StarknetChainId.TESTNET,  # Use TESTNET chain ID for local network
+    StarknetChainId.MAINNET.value: StarknetChainId.MAINNET,
+    StarknetChainId.TESTNET.value: StarknetChainId.TESTNET,
+    **{name: StarknetChainId(data[0]) for name, data in NETWORKS.items()},
+}
 
 
 def get_chain_id(network_id: Union[str, int]) -> StarknetChainId:
-    if isinstance(network_id, int):
-        return StarknetChainId(network_id)
+    try:
+        return _CHAIN_IDS_BY_KEY[network_id]
+    except KeyError:
+        if isinstance(network_id, int):
+            return StarknetChainId(network_id)
 
-    elif network_id == LOCAL_NETWORK_NAME:
-        return StarknetChainId.TESTNET  # Use TESTNET chain ID for local network
+        raise StarknetProviderError(f"Unknown network '{network_id}'.") from None
 
-    elif network_id not in NETWORKS:
-        raise StarknetProviderError(f"Unknown network '{network_id}'.")
 
-    return StarknetChainId(NETWORKS[network_id][0])
+_pedersen_hash_fn: Optional[Callable[[int, int], int]] = None
 
 
-def to_checksum_address(address: RawAddress) -> AddressType:
-    if is_checksum_address(address):
-        return cast(AddressType, address)
+def _pedersen_hash(left: int, right: int) -> int:
+    # Defer importing the fast Pedersen implementation until a checksum is
+    # actually computed; it is only needed on this path.
+    global _pedersen_hash_fn
+    hash_fn = _pedersen_hash_fn
+    if hash_fn is None:
+        from starkware.crypto.signature.fast_pedersen_hash import pedersen_hash as hash_fn
 
-    return _to_checksum_address(address)
+        _pedersen_hash_fn = hash_fn
 
+    return hash_fn(left, right)
 
-def _to_checksum_address(address: RawAddress) -> AddressType:
+
+def to_checksum_address(address: RawAddress) -> AddressType:
+    # Computing the canonical form unconditionally is cheaper than the old
+    # is_checksum_address pre-check, which hashed the address anyway just to
+    # decide whether to hash it again.
     if isinstance(address, bytes):
         address = HexBytes(address).hex()
 
-    address_int = parse_address(address)
-    address_str = pad_hex_str(HexBytes(address_int).hex().lower())
-    chars = [c for c in remove_0x_prefix(HexStr(address_str))]
-    hashed = [b for b in HexBytes(pedersen_hash(0, address_int))]
+    return _checksum_from_int(parse_address(address))
+
+
+def _checksum_case_kernel(addr: bytearray, hashed: bytes) -> None:
+    # Each hash byte drives the casing of two hex characters. Iterating the
+    # digest directly replaces the per-character index arithmetic and the
+    # IndexError guard of the old loop while keeping the same alignment
+    # (the digest's minimal big-endian bytes map to the front of the string).
+    # Lowercase hex letters occupy 0x61-0x66; subtracting 0x20 uppercases
+    # them in place, and digits (0x30-0x39) fall below the guard.
+    for i in range(min(len(hashed), len(addr) >> 1)):
+        byte = hashed[i]
+        if byte >> 4 >= 8 and addr[2 * i] >= 0x61:
+            addr[2 * i] -= 0x20
+        if (byte & 0x0F) >= 8 and addr[2 * i + 1] >= 0x61:
+            addr[2 * i + 1] -= 0x20
+
+
+@lru_cache(maxsize=4096)
+def _checksum_from_int(address_int: int) -> AddressType:
+    # Addresses repeat constantly in log decoding and receipts, and each
+    # checksum costs a Pedersen hash - cache on the canonical int form.
+    addr = bytearray(address_int.to_bytes(32, "big").hex(), "ascii")
+    hash_int = _pedersen_hash(0, address_int)
+    # Minimal-length big-endian bytes, matching HexBytes(int) - the digest
+    # length feeds the casing alignment, so a fixed width would change output.
+    hashed = hash_int.to_bytes((hash_int.bit_length() + 7) // 8 or 1, "big")
+    _checksum_case_kernel(addr, hashed)
+    return AddressType(HexAddress(add_0x_prefix(HexStr(addr.decode("ascii")))))
 
-    for i in range(0, len(chars), 2):
-        try:
-            if hashed[i >> 1] >> 4 >= 8:
-                chars[i] = chars[i].upper()
-            if (hashed[i >> 1] & 0x0F) >= 8:
-                chars[i + 1] = chars[i + 1].upper()
-        except IndexError:
-            continue
 
-    return AddressType(HexAddress(add_0x_prefix(HexStr("".join(chars)))))
+def is_hex_address(value: Any) -> bool:
+    # Same as from eth-utils except not limited length. bytes.translate scans
+    # in C; deleting every hex digit leaves an empty result iff valid.
+    if not is_text(value):
+        return False
 
+    try:
+        raw = value.encode("ascii")
+    except UnicodeEncodeError:
+        return False
 
-def is_hex_address(value: Any) -> bool:
-    return _HEX_ADDRESS_REG_EXP.fullmatch(value) is not None if is_text(value) else False
+    if raw[:2] in (b"0x", b"0X"):
+        raw = raw[2:]
+
+    return not raw.translate(None, _HEX_CHARS)
 
 
 def is_checksum_address(value: Any) -> bool:
@@ -117,7 +197,7 @@ def is_checksum_address(value: Any) -> bool:
     if not is_hex_address(value):
         return False
 
-    return value == _to_checksum_address(value)
+    return value == _checksum_from_int(parse_address(value))
 
 
 def extract_trace_data(trace: BlockSingleTransactionTrace) -> Dict[str, Any]:
@@ -144,17 +224,44 @@ def extract_trace_data(trace: BlockSingleTransactionTrace) -> Dict[str, Any]:
 
 
 def handle_client_errors(f):
-    def func(*args, **kwargs):
-        try:
-            result = f(*args, **kwargs)
-            if isinstance(result, dict) and result.get("error"):
-                message = result["error"].get("message") or "Transaction failed"
-                raise StarknetProviderError(message)
+    # Specialize the wrapper at decoration time: methods annotated with a
+    # non-dict return type can never produce an error dict, so skip the
+    # isinstance / get pair on every successful call.
+    try:
+        return_type = get_type_hints(f).get("return")
+    except Exception:
+        return_type = None
+
+    may_return_dict = (
+        return_type is None
+        or return_type in (dict, Dict, Any)
+        or getattr(return_type, "__origin__", None) is dict
+    )
 
-            return result
+    if may_return_dict:
 
-        except Exception as err:
-            raise handle_client_error(err) from err
+        @wraps(f)
+        def func(*args, **kwargs):
+            try:
+                result = f(*args, **kwargs)
+                if isinstance(result, dict) and result.get("error"):
+                    message = result["error"].get("message") or "Transaction failed"
+                    raise StarknetProviderError(message)
+
+                return result
+
+            except Exception as err:
+                raise handle_client_error(err) from err
+
+    else:
+
+        @wraps(f)
+        def func(*args, **kwargs):
+            try:
+                return f(*args, **kwargs)
+
+            except Exception as err:
+                raise handle_client_error(err) from err
 
     return func
 
@@ -183,35 +290,66 @@ def handle_client_error(err: Exception) -> Optional[Exception]:
 
     err_msg = err_msg.strip()
 
-    # Handle when JSON
-    try:
-        err_msg_dict = loads(err_msg)
-        if "message" in err_msg_dict:
-            err_msg = err_msg_dict["message"]
+    # Handle when JSON. Only attempt parsing when the message is plausibly
+    # JSON-shaped; most Cairo errors are plain text.
+    if err_msg.startswith("{") and err_msg.endswith("}"):
+        try:
+            err_msg_dict = loads(err_msg)
+            if "message" in err_msg_dict:
+                err_msg = err_msg_dict["message"]
 
-    except JSONDecodeError:
-        pass
+        except JSONDecodeError:
+            pass
 
     return StarknetProviderError(err_msg)
 
 
+def _adjust_deploy_tx_dict(txn_dict: Dict, txn_info: DeployTransaction):
+    txn_dict["contract_address"] = to_checksum_address(txn_info.contract_address)
+    txn_dict["max_fee"] = 0
+    txn_dict["type"] = TransactionType.DEPLOY
+
+
+def _adjust_invoke_tx_dict(txn_dict: Dict, txn_info: InvokeTransaction):
+    txn_dict["contract_address"] = to_checksum_address(txn_info.contract_address)
+    txn_dict["type"] = TransactionType.INVOKE_FUNCTION
+
+
+def _adjust_declare_tx_dict(txn_dict: Dict, txn_info: DeclareTransaction):
+    txn_dict["sender"] = to_checksum_address(txn_info.sender_address)
+    txn_dict["type"] = TransactionType.DECLARE
+
+
+_TX_DICT_ADJUSTERS: Dict[type, Callable[[Dict, Transaction], None]] = {
+    DeployTransaction: _adjust_deploy_tx_dict,
+    InvokeTransaction: _adjust_invoke_tx_dict,
+    DeclareTransaction: _adjust_declare_tx_dict,
+}
+
+
+@lru_cache(maxsize=None)
+def _txn_field_names(txn_cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(txn_cls))
+
+
 def get_dict_from_tx_info(txn_info: Transaction) -> Dict:
-    txn_dict = {**asdict(txn_info)}
-
-    if isinstance(txn_info, DeployTransaction):
-        txn_dict["contract_address"] = to_checksum_address(txn_info.contract_address)
-        txn_dict["max_fee"] = 0
-        txn_dict["type"] = TransactionType.DEPLOY
-    elif isinstance(txn_info, InvokeTransaction):
-        txn_dict["contract_address"] = to_checksum_address(txn_info.contract_address)
-        txn_dict["type"] = TransactionType.INVOKE_FUNCTION
-    elif isinstance(txn_info, DeclareTransaction):
-        txn_dict["sender"] = to_checksum_address(txn_info.sender_address)
-        txn_dict["type"] = TransactionType.DECLARE
+    # A shallow per-field copy; asdict() recursively deep-copies calldata and
+    # signature lists that this path only reads.
+    txn_dict = {name: getattr(txn_info, name) for name in _txn_field_names(type(txn_info))}
+    adjust = _TX_DICT_ADJUSTERS.get(type(txn_info))
+    if adjust is not None:
+        adjust(txn_dict, txn_info)
 
     return txn_dict
 
 
+@lru_cache(maxsize=256)
+def _selector_table(method_names: Tuple[str, ...]) -> Dict[int, str]:
+    # Selectors are Pedersen-style hashes and never change for a given set of
+    # method names, so compute them once per contract shape.
+    return {get_cached_selector(name): name for name in method_names}
+
+
 def get_method_abi_from_selector(
     selector: Union[str, int], contract_type: ContractType
 ) -> MethodABI:
@@ -220,11 +358,10 @@ def get_method_abi_from_selector(
     if isinstance(selector, str):
         selector = int(selector, 16)
 
-    for abi in contract_type.mutable_methods:
-        selector_to_check = get_selector_from_name(abi.name)
-
-        if selector == selector_to_check:
-            return abi
+    methods_by_name = {abi.name: abi for abi in contract_type.mutable_methods}
+    method_name = _selector_table(tuple(methods_by_name)).get(selector)
+    if method_name is not None:
+        return methods_by_name[method_name]
 
     raise ContractError(f"Method '{selector}' not found in '{contract_type.name}'.")
 
@@ -235,19 +372,50 @@ def get_random_private_key() -> str:
 
 
 def pad_hex_str(value: str, to_length: int = 66) -> str:
-    val = value.replace("0x", "")
-    actual_len = len(val)
-    padding = "0" * (to_length - 2 - actual_len)
-    return f"0x{padding}{val}"
+    # 'str.zfill' pads in a single C-level call.
+    val = value[2:] if value.startswith("0x") else value
+    return "0x" + val.zfill(to_length - 2)
+
+
+# One plugin-owned loop for all synchronous RPC dispatch. Looking a loop up
+# through 'asyncio.get_event_loop()' on every call pays for policy machinery
+# each time and is deprecated outside a running loop on newer Pythons.
+_EVENT_LOOP = asyncio.new_event_loop()
+_EVENT_LOOP_LOCK = threading.Lock()
+atexit.register(_EVENT_LOOP.close)
 
 
 def run_until_complete(coroutine):
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(coroutine)
+    with _EVENT_LOOP_LOCK:
+        return _EVENT_LOOP.run_until_complete(coroutine)
+
+
+async def _gather(coroutines):
+    return await asyncio.gather(*coroutines)
+
+
+def run_until_complete_many(*coroutines) -> List[Any]:
+    """
+    Run several coroutines concurrently on the plugin's event loop and
+    return their results in order. The coroutines must be created by the
+    caller but not yet awaited; wrapping the gather in a coroutine keeps
+    the futures bound to the plugin's loop.
+    """
+
+    with _EVENT_LOOP_LOCK:
+        return _EVENT_LOOP.run_until_complete(_gather(coroutines))
 
 
 def to_int(val) -> int:
-    if isinstance(val, str):
-        return eth_to_int(text=val)
+    # Dispatch on the concrete type up front; eth_to_int re-checks every
+    # branch on each call and this runs for every calldata felt.
+    if isinstance(val, int):
+        return val
+
+    elif isinstance(val, (bytes, bytearray)):
+        return int.from_bytes(val, "big") if val else 0
+
+    elif isinstance(val, str):
+        return int(val, 16) if val[:2] in ("0x", "0X") else int(val)
 
     return eth_to_int(val)
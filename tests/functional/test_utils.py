@@ -11,6 +11,7 @@ from ape_starknet.utils import (
     get_random_private_key,
     handle_client_error,
     is_checksum_address,
+    is_hex_address,
     to_checksum_address,
 )
 
@@ -24,6 +25,20 @@ def test_get_random_private_key(iteration):
     assert pkey_back_to_str.replace("0x", "") in pkey
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("0x6b7243AA4edbe5BD629c6712B3aC9639B160480A7730A31483F7B387463a183", True),
+        ("0X6B7243AA4EDBE5BD629C6712B3AC9639B160480A7730A31483F7B387463A183", True),
+        ("6b7243aa4edbe5bd629c6712b3ac9639b160480a7730a31483f7b387463a183", True),
+        ("0xNOTHEX", False),
+        (123, False),
+    ],
+)
+def test_is_hex_address(value, expected):
+    assert is_hex_address(value) is expected
+
+
 def test_is_checksum_address(account):
     assert is_checksum_address(account.address)
 